@@ -32,5 +32,7 @@ pub fn y_py(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(encode_state_vector))?;
     m.add_wrapped(wrap_pyfunction!(encode_state_as_update))?;
     m.add_wrapped(wrap_pyfunction!(apply_update))?;
+    m.add_wrapped(wrap_pyfunction!(merge_updates))?;
+    m.add_wrapped(wrap_pyfunction!(sync_pair))?;
     Ok(())
 }
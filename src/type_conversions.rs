@@ -2,6 +2,7 @@ use lib0::any::Any;
 use pyo3::create_exception;
 use pyo3::exceptions::PyException;
 use pyo3::exceptions::PyTypeError;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types as pytypes;
 use pyo3::types::PyList;
@@ -59,23 +60,23 @@ impl ToPython for Delta {
         match self {
             Delta::Inserted(value, attrs) => {
                 let value = value.clone().into_py(py);
-                result.set_item("insert", value).unwrap();
+                result.set_item(intern!(py, "insert"), value).unwrap();
 
                 if let Some(attrs) = attrs {
                     let attrs = attrs_into_py(attrs.deref());
-                    result.set_item("attributes", attrs).unwrap();
+                    result.set_item(intern!(py, "attributes"), attrs).unwrap();
                 }
             }
             Delta::Retain(len, attrs) => {
-                result.set_item("retain", len).unwrap();
+                result.set_item(intern!(py, "retain"), len).unwrap();
 
                 if let Some(attrs) = attrs {
                     let attrs = attrs_into_py(attrs.deref());
-                    result.set_item("attributes", attrs).unwrap();
+                    result.set_item(intern!(py, "attributes"), attrs).unwrap();
                 }
             }
             Delta::Deleted(len) => {
-                result.set_item("delete", len).unwrap();
+                result.set_item(intern!(py, "delete"), len).unwrap();
             }
         }
         result.into()
@@ -101,13 +102,13 @@ impl ToPython for &Change {
             Change::Added(values) => {
                 let values: Vec<PyObject> =
                     values.into_iter().map(|v| v.clone().into_py(py)).collect();
-                result.set_item("insert", values).unwrap();
+                result.set_item(intern!(py, "insert"), values).unwrap();
             }
             Change::Removed(len) => {
-                result.set_item("delete", len).unwrap();
+                result.set_item(intern!(py, "delete"), len).unwrap();
             }
             Change::Retain(len) => {
-                result.set_item("retain", len).unwrap();
+                result.set_item(intern!(py, "retain"), len).unwrap();
             }
         }
         result.into()
@@ -120,24 +121,24 @@ struct EntryChangeWrapper<'a>(&'a EntryChange);
 impl<'a> IntoPy<PyObject> for EntryChangeWrapper<'a> {
     fn into_py(self, py: Python) -> PyObject {
         let result = pytypes::PyDict::new(py);
-        let action = "action";
+        let action = intern!(py, "action");
         match self.0 {
             EntryChange::Inserted(new) => {
                 let new_value = new.clone().into_py(py);
-                result.set_item(action, "add").unwrap();
-                result.set_item("newValue", new_value).unwrap();
+                result.set_item(action, intern!(py, "add")).unwrap();
+                result.set_item(intern!(py, "newValue"), new_value).unwrap();
             }
             EntryChange::Updated(old, new) => {
                 let old_value = old.clone().into_py(py);
                 let new_value = new.clone().into_py(py);
-                result.set_item(action, "update").unwrap();
-                result.set_item("oldValue", old_value).unwrap();
-                result.set_item("newValue", new_value).unwrap();
+                result.set_item(action, intern!(py, "update")).unwrap();
+                result.set_item(intern!(py, "oldValue"), old_value).unwrap();
+                result.set_item(intern!(py, "newValue"), new_value).unwrap();
             }
             EntryChange::Removed(old) => {
                 let old_value = old.clone().into_py(py);
-                result.set_item(action, "delete").unwrap();
-                result.set_item("oldValue", old_value).unwrap();
+                result.set_item(action, intern!(py, "delete")).unwrap();
+                result.set_item(intern!(py, "oldValue"), old_value).unwrap();
             }
         }
         result.into()
@@ -285,20 +286,15 @@ impl ToPython for Any {
                 byte_array.into()
             }
             Any::Array(v) => {
-                let mut a = Vec::new();
-                for value in v.iter() {
-                    let value = value.to_owned();
-                    a.push(value);
-                }
-                a.into_py(py)
+                let elements = v.into_vec().into_iter().map(|value| value.into_py(py));
+                pytypes::PyList::new(py, elements).into()
             }
             Any::Map(v) => {
-                let mut m = HashMap::new();
-                for (k, v) in v.iter() {
-                    let value = v.to_owned();
-                    m.insert(k, value);
+                let py_dict = pytypes::PyDict::new(py);
+                for (k, value) in v.into_iter() {
+                    py_dict.set_item(k, value.into_py(py)).unwrap();
                 }
-                m.into_py(py)
+                py_dict.into()
             }
         }
     }
@@ -317,6 +313,31 @@ impl ToPython for Value {
     }
 }
 
+/// Compares two `Any` values following Python equality semantics: bools and
+/// numbers are compared by numeric value (`True == 1`, `2**53 == 2.0**53`) and
+/// containers are compared element-wise under the same rules.
+pub(crate) fn py_any_eq(a: &Any, b: &Any) -> bool {
+    fn as_number(v: &Any) -> Option<f64> {
+        match v {
+            Any::Bool(b) => Some(if *b { 1.0 } else { 0.0 }),
+            Any::Number(n) => Some(*n),
+            Any::BigInt(i) => Some(*i as f64),
+            _ => None,
+        }
+    }
+    match (a, b) {
+        (Any::Array(a), Any::Array(b)) => {
+            a.len() == b.len() && a.iter().zip(b.iter()).all(|(a, b)| py_any_eq(a, b))
+        }
+        (Any::Map(a), Any::Map(b)) => {
+            a.len() == b.len()
+                && a.iter()
+                    .all(|(k, a)| b.get(k).map_or(false, |b| py_any_eq(a, b)))
+        }
+        _ => a == b || matches!((as_number(a), as_number(b)), (Some(a), Some(b)) if a == b),
+    }
+}
+
 pub(crate) fn events_into_py(txn: &Transaction, events: &Events) -> PyObject {
     Python::with_gil(|py| {
         let py_events = events.iter().map(|event| match event {
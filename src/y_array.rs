@@ -6,6 +6,7 @@ use crate::shared_types::{
     DeepSubscription, DefaultPyErr, PreliminaryObservationException, ShallowSubscription, SubId,
 };
 use crate::type_conversions::events_into_py;
+use crate::type_conversions::py_any_eq;
 use crate::y_transaction::YTransaction;
 
 use super::shared_types::SharedType;
@@ -14,10 +15,13 @@ use lib0::any::Any;
 use pyo3::exceptions::PyIndexError;
 
 use crate::type_conversions::PyObjectWrapper;
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
+use pyo3::types as pytypes;
 use pyo3::types::{PyList, PySlice, PySliceIndices};
 use yrs::types::array::{ArrayEvent, ArrayIter};
 use yrs::types::DeepObservable;
+use yrs::types::Value;
 use yrs::{Array, SubscriptionId, Transaction};
 
 /// A collection used to store data in an indexed sequence structure. This type is internally
@@ -121,6 +125,21 @@ impl YArray {
         index: u32,
         items: PyObject,
     ) -> PyResult<()> {
+        if let SharedType::Integrated(array) = &self.0 {
+            if array.len() >= index {
+                let anys = Python::with_gil(|py| {
+                    items
+                        .as_ref(py)
+                        .downcast::<PyList>()
+                        .ok()
+                        .and_then(Self::try_primitive_anys)
+                });
+                if let Some(anys) = anys {
+                    array.insert_range(txn, index, anys);
+                    return Ok(());
+                }
+            }
+        }
         let items = Self::py_iter(items)?;
         match &mut self.0 {
             SharedType::Integrated(array) if array.len() >= index => {
@@ -139,6 +158,58 @@ impl YArray {
         }
     }
 
+    /// Inserts a contiguous numeric buffer (anything exposing the buffer protocol, e.g.
+    /// `array.array` or a NumPy array) into this `YArray` instance, starting at given `index`.
+    /// The numbers are read straight out of the buffer, without materializing an intermediate
+    /// Python object per element.
+    pub fn insert_range_buffer(
+        &mut self,
+        txn: &mut YTransaction,
+        index: u32,
+        buffer: &PyAny,
+    ) -> PyResult<()> {
+        const MAX_JS_NUMBER: i64 = 2_i64.pow(53) - 1;
+        let py = buffer.py();
+        let anys: Vec<Any> = if let Ok(buf) = PyBuffer::<f64>::get(buffer) {
+            buf.to_vec(py)?.into_iter().map(Any::Number).collect()
+        } else if let Ok(buf) = PyBuffer::<i64>::get(buffer) {
+            buf.to_vec(py)?
+                .into_iter()
+                .map(|num| {
+                    if num > MAX_JS_NUMBER {
+                        Any::BigInt(num)
+                    } else {
+                        Any::Number(num as f64)
+                    }
+                })
+                .collect()
+        } else if let Ok(buf) = PyBuffer::<i32>::get(buffer) {
+            buf.to_vec(py)?
+                .into_iter()
+                .map(|num| Any::Number(num as f64))
+                .collect()
+        } else {
+            return Err(pyo3::exceptions::PyTypeError::new_err(
+                "Expected a contiguous buffer of 64-bit floats or 32/64-bit ints (e.g. array('d', ...))",
+            ));
+        };
+        match &mut self.0 {
+            SharedType::Integrated(array) if array.len() >= index => {
+                array.insert_range(txn, index, anys);
+                Ok(())
+            }
+            SharedType::Prelim(vec) if vec.len() >= index as usize => {
+                let mut j = index as usize;
+                for any in anys {
+                    vec.insert(j, any.into_py(py));
+                    j += 1;
+                }
+                Ok(())
+            }
+            _ => Err(PyIndexError::default_message()),
+        }
+    }
+
     /// Appends a range of `items` at the end of this `YArray` instance.
     pub fn extend(&mut self, txn: &mut YTransaction, items: PyObject) -> PyResult<()> {
         let index = self.__len__() as u32;
@@ -177,6 +248,96 @@ impl YArray {
         }
     }
 
+    /// Replaces the whole content of this `YArray` instance with a provided range of `items` in
+    /// one call, saving the `len()` round-trip and the separate delete/insert dispatches of the
+    /// `delete_range` + `extend` reset pattern.
+    pub fn replace_all(&mut self, txn: &mut YTransaction, items: PyObject) -> PyResult<()> {
+        // Convert `items` before touching the current content, so that a bad
+        // argument leaves the array intact
+        if let SharedType::Integrated(array) = &self.0 {
+            let anys = Python::with_gil(|py| {
+                items
+                    .as_ref(py)
+                    .downcast::<PyList>()
+                    .ok()
+                    .and_then(Self::try_primitive_anys)
+            });
+            if let Some(anys) = anys {
+                let len = array.len();
+                array.remove_range(txn, 0, len);
+                array.insert_range(txn, 0, anys);
+                return Ok(());
+            }
+        }
+        let items = Self::py_iter(items)?;
+        match &mut self.0 {
+            SharedType::Integrated(array) => {
+                let len = array.len();
+                array.remove_range(txn, 0, len);
+                Self::insert_multiple_at(array, txn, 0, items);
+            }
+            SharedType::Prelim(vec) => {
+                vec.clear();
+                vec.extend(items);
+            }
+        }
+        Ok(())
+    }
+
+    /// Applies a batch of operations to this `YArray` instance in a single call. Each operation
+    /// is a tuple: `("insert", index, items)` inserts a range of `items` at `index`, while
+    /// `("delete", index, length)` removes `length` elements starting at `index`. Batching the
+    /// operations avoids one Python-to-Rust round-trip per mutation in tight loops.
+    pub fn apply_ops(
+        &mut self,
+        txn: &mut YTransaction,
+        ops: Vec<(String, u32, PyObject)>,
+    ) -> PyResult<()> {
+        for (op, index, arg) in ops {
+            match op.as_str() {
+                "insert" => self.insert_range(txn, index, arg)?,
+                "delete" => {
+                    let length: u32 = Python::with_gil(|py| arg.extract(py))?;
+                    self.delete_range(txn, index, length);
+                }
+                _ => {
+                    return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                        "Operations must be formatted as ('insert' | 'delete', index, arg) tuples, found: '{}'",
+                        op
+                    )))
+                }
+            }
+        }
+        Ok(())
+    }
+
+    /// Checks if a provided `item` is stored within this instance of `YArray`. Primitive values
+    /// are compared natively as `Any`, without converting every stored element back into a Python
+    /// object.
+    pub fn __contains__(&self, item: PyObject) -> bool {
+        match &self.0 {
+            SharedType::Integrated(arr) => {
+                let target: Result<Any, _> = PyObjectWrapper(item.clone()).try_into();
+                if let Ok(target) = target {
+                    arr.iter().any(|value| match value {
+                        Value::Any(any) => py_any_eq(&any, &target),
+                        _ => false,
+                    })
+                } else {
+                    Python::with_gil(|py| {
+                        arr.iter().any(|value| {
+                            let element = value.into_py(py);
+                            py_eq(py, &item, &element)
+                        })
+                    })
+                }
+            }
+            SharedType::Prelim(vec) => {
+                Python::with_gil(|py| vec.iter().any(|element| py_eq(py, &item, element)))
+            }
+        }
+    }
+
     pub fn __getitem__(&self, index: Index) -> PyResult<PyObject> {
         // Apply index to the Array type
         match index {
@@ -211,7 +372,10 @@ impl YArray {
                 InnerYArrayIter::Prelim((*this).iter())
             },
         };
-        YArrayIterator(ManuallyDrop::new(inner_iter))
+        YArrayIterator {
+            inner: ManuallyDrop::new(inner_iter),
+            buffer: Vec::new(),
+        }
     }
 
     /// Subscribes to all operations happening over this instance of `YArray`. All changes are
@@ -298,7 +462,7 @@ impl YArray {
                 if step < 0 {
                     let step = step.abs() as usize;
                     let (start, stop) = ((stop + 1) as usize, (start + 1) as usize);
-                    let values: Vec<PyObject> = arr
+                    let mut values: Vec<PyObject> = arr
                         .iter()
                         .enumerate()
                         .skip(start)
@@ -306,8 +470,8 @@ impl YArray {
                         .take_while(|(i, _)| i < &stop)
                         .map(|(_, el)| el.into_py(py))
                         .collect();
-                    let values: Vec<PyObject> = values.into_iter().rev().collect();
-                    Ok(values.into_py(py))
+                    values.reverse();
+                    Ok(PyList::new(py, values).into())
                 } else {
                     let (start, stop, step) = (start as usize, stop as usize, step as usize);
                     let values: Vec<PyObject> = arr
@@ -318,7 +482,7 @@ impl YArray {
                         .take_while(|(i, _)| i < &stop)
                         .map(|(_, el)| el.into_py(py))
                         .collect();
-                    Ok(values.into_py(py))
+                    Ok(PyList::new(py, values).into())
                 }
             }),
             SharedType::Prelim(arr) => Python::with_gil(|py| {
@@ -373,21 +537,78 @@ impl YArray {
         }
     }
 
+    /// Attempts to convert a list of homogeneous primitives (all ints, all floats or all strings)
+    /// into a `Vec<Any>` in one monomorphic pass, skipping the per-element type dispatch of the
+    /// generic conversion. Returns `None` whenever the fast path does not apply, leaving the
+    /// caller to fall back onto the generic one.
+    fn try_primitive_anys(list: &PyList) -> Option<Vec<Any>> {
+        const MAX_JS_NUMBER: i64 = 2_i64.pow(53) - 1;
+        let first = list.iter().next()?;
+        let first_type = first.get_type();
+        let mut anys = Vec::with_capacity(list.len());
+        if first.downcast::<pytypes::PyBool>().is_ok() {
+            // bool is a subclass of int and must keep its boolean identity
+            return None;
+        } else if first.downcast::<pytypes::PyInt>().is_ok() {
+            for item in list.iter() {
+                if !item.get_type().is(first_type) {
+                    return None;
+                }
+                let num: i64 = item.extract().ok()?;
+                anys.push(if num > MAX_JS_NUMBER {
+                    Any::BigInt(num)
+                } else {
+                    Any::Number(num as f64)
+                });
+            }
+        } else if first.downcast::<pytypes::PyFloat>().is_ok() {
+            for item in list.iter() {
+                if !item.get_type().is(first_type) {
+                    return None;
+                }
+                anys.push(Any::Number(item.extract().ok()?));
+            }
+        } else if first.downcast::<pytypes::PyString>().is_ok() {
+            for item in list.iter() {
+                if !item.get_type().is(first_type) {
+                    return None;
+                }
+                let string: String = item.extract().ok()?;
+                anys.push(Any::String(string.into_boxed_str()));
+            }
+        } else {
+            return None;
+        }
+        Some(anys)
+    }
+
     fn py_iter(iterable: PyObject) -> PyResult<Vec<PyObject>> {
         Python::with_gil(|py| {
-            iterable.as_ref(py).iter().and_then(|iterable| {
-                iterable
-                    .map(|element| {
-                        element.map(|el| {
-                            let el: PyObject = el.into();
-                            el
-                        })
-                    })
-                    .collect()
-            })
+            let iterable = iterable.as_ref(py);
+            // exact for lists/tuples, approximate for generators; avoids the
+            // geometric reallocations of growing the Vec from empty. The hint
+            // is advisory and user-controlled (PEP 424), so cap it rather than
+            // letting a hostile __length_hint__ trigger a huge allocation
+            let hint =
+                unsafe { pyo3::ffi::PyObject_LengthHint(pyo3::AsPyPointer::as_ptr(iterable), 0) };
+            if hint < 0 {
+                unsafe { pyo3::ffi::PyErr_Clear() };
+            }
+            let mut elements: Vec<PyObject> = Vec::with_capacity(hint.clamp(0, 4096) as usize);
+            for element in iterable.iter()? {
+                elements.push(element?.into());
+            }
+            Ok(elements)
         })
     }
 }
+fn py_eq(py: Python, a: &PyObject, b: &PyObject) -> bool {
+    a.as_ref(py)
+        .rich_compare(b.as_ref(py), pyo3::basic::CompareOp::Eq)
+        .and_then(|result| result.is_true())
+        .unwrap_or(false)
+}
+
 #[derive(FromPyObject)]
 pub enum Index<'a> {
     Int(isize),
@@ -399,12 +620,35 @@ enum InnerYArrayIter {
     Prelim(std::slice::Iter<'static, PyObject>),
 }
 
+/// Number of elements converted ahead of time per GIL acquisition while iterating.
+const ITER_CHUNK_SIZE: usize = 64;
+
 #[pyclass(unsendable)]
-pub struct YArrayIterator(ManuallyDrop<InnerYArrayIter>);
+pub struct YArrayIterator {
+    inner: ManuallyDrop<InnerYArrayIter>,
+    /// Upcoming elements in reverse order, so that the next one can be popped off the end.
+    buffer: Vec<PyObject>,
+}
+
+impl YArrayIterator {
+    fn refill(&mut self) {
+        let mut chunk: Vec<PyObject> = match self.inner.deref_mut() {
+            InnerYArrayIter::Integrated(iter) => Python::with_gil(|py| {
+                iter.by_ref()
+                    .take(ITER_CHUNK_SIZE)
+                    .map(|v| v.into_py(py))
+                    .collect()
+            }),
+            InnerYArrayIter::Prelim(iter) => iter.by_ref().take(ITER_CHUNK_SIZE).cloned().collect(),
+        };
+        chunk.reverse();
+        self.buffer = chunk;
+    }
+}
 
 impl Drop for YArrayIterator {
     fn drop(&mut self) {
-        unsafe { ManuallyDrop::drop(&mut self.0) }
+        unsafe { ManuallyDrop::drop(&mut self.inner) }
     }
 }
 
@@ -412,12 +656,10 @@ impl Iterator for YArrayIterator {
     type Item = PyObject;
 
     fn next(&mut self) -> Option<Self::Item> {
-        match self.0.deref_mut() {
-            InnerYArrayIter::Integrated(iter) => {
-                Python::with_gil(|py| iter.next().map(|v| v.into_py(py)))
-            }
-            InnerYArrayIter::Prelim(iter) => iter.next().cloned(),
+        if self.buffer.is_empty() {
+            self.refill();
         }
+        self.buffer.pop()
     }
 }
 
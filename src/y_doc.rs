@@ -1,19 +1,23 @@
 use crate::y_array::YArray;
 use crate::y_map::YMap;
 use crate::y_text::YText;
+use crate::y_transaction::EncodingException;
 use crate::y_transaction::YTransaction;
 use crate::y_xml::YXmlElement;
 use crate::y_xml::YXmlText;
 use pyo3::prelude::*;
 use pyo3::types::PyBytes;
 use pyo3::types::PyTuple;
+use yrs::updates::decoder::Decode;
 use yrs::updates::encoder::Encode;
+use yrs::updates::encoder::{Encoder, EncoderV1};
 use yrs::AfterTransactionEvent as YrsAfterTransactionEvent;
 use yrs::Doc;
 use yrs::OffsetKind;
 use yrs::Options;
 use yrs::SubscriptionId;
 use yrs::Transaction;
+use yrs::Update;
 
 /// A Ypy document type. Documents are most important units of collaborative resources management.
 /// All shared collections live within a scope of their corresponding documents. All updates are
@@ -55,15 +59,23 @@ impl YDoc {
         }
 
         if let Some(raw_offset) = offset_kind {
-            let clean_offset = raw_offset.to_lowercase().replace("-", "");
-            let offset = match clean_offset.as_str() {
-                "utf8" => Ok(OffsetKind::Bytes),
-                "utf16" => Ok(OffsetKind::Utf16),
-                "utf32" => Ok(OffsetKind::Utf32),
-                _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
-                    "'{}' is not a valid offset kind (utf8, utf16, or utf32).",
-                    clean_offset
-                ))),
+            let offset = match raw_offset.as_str() {
+                // common spellings first, without allocating a normalized copy
+                "utf8" | "utf-8" | "UTF8" | "UTF-8" => Ok(OffsetKind::Bytes),
+                "utf16" | "utf-16" | "UTF16" | "UTF-16" => Ok(OffsetKind::Utf16),
+                "utf32" | "utf-32" | "UTF32" | "UTF-32" => Ok(OffsetKind::Utf32),
+                _ => {
+                    let clean_offset = raw_offset.to_lowercase().replace("-", "");
+                    match clean_offset.as_str() {
+                        "utf8" => Ok(OffsetKind::Bytes),
+                        "utf16" => Ok(OffsetKind::Utf16),
+                        "utf32" => Ok(OffsetKind::Utf32),
+                        _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+                            "'{}' is not a valid offset kind (utf8, utf16, or utf32).",
+                            clean_offset
+                        ))),
+                    }
+                }
             }?;
             options.offset_kind = offset;
         }
@@ -109,6 +121,20 @@ impl YDoc {
         })
     }
 
+    /// Runs a sequence of callbacks within a single transaction and returns their results.
+    /// Unlike calling `transact` once per callback, the document commits (and dispatches
+    /// observers, and encodes updates) only once for the whole batch.
+    pub fn batch_transact(&mut self, callbacks: Vec<PyObject>) -> PyResult<Vec<PyObject>> {
+        let txn = self.begin_transaction();
+        Python::with_gil(|py| {
+            let txn: PyObject = txn.into_py(py);
+            callbacks
+                .into_iter()
+                .map(|callback| callback.call1(py, (txn.clone_ref(py),)))
+                .collect()
+        })
+    }
+
     /// Returns a `YMap` shared data type, that's accessible for subsequent accesses using given
     /// `name`.
     ///
@@ -253,6 +279,62 @@ pub fn apply_update(doc: &mut YDoc, diff: Vec<u8>) -> PyResult<()> {
     Ok(())
 }
 
+/// Synchronizes a pair of documents in both directions within a single native call. The
+/// intermediate state vectors and update payloads never cross into Python, which saves two
+/// encode/decode round-trips per pair compared to driving the exchange through
+/// `encode_state_vector`/`encode_state_as_update`/`apply_update`.
+#[pyfunction]
+pub fn sync_pair(doc_a: &mut YDoc, doc_b: &mut YDoc) -> PyResult<()> {
+    let mut txn_a = doc_a.0.transact();
+    let mut txn_b = doc_b.0.transact();
+
+    // Encode both directions before applying either, so neither side echoes
+    // the changes it is just about to receive.
+    let diff_for_b = {
+        let mut encoder = EncoderV1::new();
+        txn_a.encode_diff(&txn_b.state_vector(), &mut encoder);
+        encoder.to_vec()
+    };
+    let diff_for_a = {
+        let mut encoder = EncoderV1::new();
+        txn_b.encode_diff(&txn_a.state_vector(), &mut encoder);
+        encoder.to_vec()
+    };
+
+    let update = Update::decode_v1(diff_for_b.as_slice())
+        .map_err(|e| EncodingException::new_err(e.to_string()))?;
+    txn_b.apply_update(update);
+    let update = Update::decode_v1(diff_for_a.as_slice())
+        .map_err(|e| EncodingException::new_err(e.to_string()))?;
+    txn_a.apply_update(update);
+    Ok(())
+}
+
+/// Merges a sequence of updates (encoded using lib0 v1 encoding) into a single update payload.
+/// The combined update can be applied in one `apply_update` call, which is cheaper than applying
+/// each of the source updates individually.
+///
+/// Example:
+///
+/// ```python
+/// from y_py import YDoc, encode_state_as_update, apply_update, merge_updates
+///
+/// update = merge_updates([encode_state_as_update(doc) for doc in docs])
+/// apply_update(local_doc, update)
+/// ```
+#[pyfunction]
+pub fn merge_updates(updates: Vec<Vec<u8>>) -> PyResult<PyObject> {
+    let updates: PyResult<Vec<Update>> = updates
+        .iter()
+        .map(|bytes| {
+            Update::decode_v1(bytes.as_slice())
+                .map_err(|e| EncodingException::new_err(e.to_string()))
+        })
+        .collect();
+    let merged = Update::merge_updates(updates?).encode_v1();
+    Ok(Python::with_gil(|py| PyBytes::new(py, &merged).into()))
+}
+
 #[pyclass(unsendable)]
 pub struct AfterTransactionEvent {
     inner: *const YrsAfterTransactionEvent,
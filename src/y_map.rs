@@ -1,18 +1,21 @@
+use lib0::any::Any;
 use pyo3::exceptions::{PyKeyError, PyTypeError};
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use std::collections::HashMap;
+use std::convert::TryInto;
 use std::mem::ManuallyDrop;
 use std::ops::DerefMut;
 use yrs::types::map::{MapEvent, MapIter};
 use yrs::types::DeepObservable;
+use yrs::types::Value;
 use yrs::{Map, SubscriptionId, Transaction};
 
 use crate::shared_types::{
     DeepSubscription, DefaultPyErr, PreliminaryObservationException, ShallowSubscription,
     SharedType, SubId,
 };
-use crate::type_conversions::{events_into_py, PyObjectWrapper, ToPython};
+use crate::type_conversions::{events_into_py, py_any_eq, PyObjectWrapper, ToPython};
 use crate::y_transaction::YTransaction;
 
 /// Collection used to store key-value entries in an unordered manner. Keys are always represented
@@ -84,10 +87,61 @@ impl YMap {
         format!("YMap({})", self.__str__())
     }
 
+    pub fn __richcmp__(&self, other: PyObject, op: pyo3::basic::CompareOp) -> PyObject {
+        Python::with_gil(|py| match op {
+            pyo3::basic::CompareOp::Eq | pyo3::basic::CompareOp::Ne => {
+                if let Ok(dict) = other.as_ref(py).downcast::<PyDict>() {
+                    let eq = self.equals_py_dict(dict);
+                    let result = match op {
+                        pyo3::basic::CompareOp::Eq => eq,
+                        _ => !eq,
+                    };
+                    result.into_py(py)
+                } else {
+                    py.NotImplemented()
+                }
+            }
+            _ => py.NotImplemented(),
+        })
+    }
+
+    /// Checks whether this `YMap` holds the same entries as a Python `dict`,
+    /// without materializing an intermediate dict. Lengths are compared first,
+    /// then each entry is probed in `other` directly.
+    pub fn equals_py_dict(&self, other: &PyDict) -> bool {
+        if self.__len__() != other.len() {
+            return false;
+        }
+        Python::with_gil(|py| match &self.0 {
+            SharedType::Integrated(map) => map.iter().all(|(k, v)| {
+                other.get_item(k).map_or(false, |probe| match &v {
+                    Value::Any(any) => {
+                        let target: Result<Any, _> = PyObjectWrapper(probe.into()).try_into();
+                        target.map_or(false, |target| py_any_eq(any, &target))
+                    }
+                    _ => v.clone().into_py(py).as_ref(py).eq(probe).unwrap_or(false),
+                })
+            }),
+            SharedType::Prelim(map) => map.iter().all(|(k, v)| {
+                other
+                    .get_item(k)
+                    .map_or(false, |probe| v.as_ref(py).eq(probe).unwrap_or(false))
+            }),
+        })
+    }
+
     /// Converts contents of this `YMap` instance into a JSON representation.
     pub fn to_json(&self) -> PyResult<PyObject> {
         Python::with_gil(|py| match &self.0 {
-            SharedType::Integrated(v) => Ok(v.to_json().into_py(py)),
+            // Build the result dict straight off the map iterator instead of
+            // collecting entries into an intermediate `Any` map first
+            SharedType::Integrated(v) => {
+                let dict = PyDict::new(py);
+                for (key, value) in v.iter() {
+                    dict.set_item(key, value.to_json().into_py(py))?;
+                }
+                Ok(dict.into())
+            }
             SharedType::Prelim(v) => {
                 let dict = PyDict::new(py);
                 for (k, v) in v.iter() {
@@ -113,9 +167,19 @@ impl YMap {
     /// Updates `YMap` with the key value pairs in the `items` object.
     pub fn update(&mut self, txn: &mut YTransaction, items: PyObject) -> PyResult<()> {
         Python::with_gil(|py| {
-            // Handle collection types
-            if let Ok(dict) = items.extract::<HashMap<String, PyObject>>(py) {
-                dict.into_iter().for_each(|(k, v)| self.set(txn, &k, v));
+            // Handle dicts directly, without copying them into an intermediate HashMap
+            if let Ok(dict) = items.as_ref(py).downcast::<PyDict>() {
+                for (k, v) in dict.iter() {
+                    match k.downcast::<pyo3::types::PyString>() {
+                        Ok(key) => self.set(txn, key.to_str()?, v.into()),
+                        Err(_) => {
+                            return Err(PyTypeError::new_err(format!(
+                                "Update items should be formatted as (str, value) tuples, found: ({}, {})",
+                                k, v
+                            )))
+                        }
+                    }
+                }
                 return Ok(());
             }
             // Handle iterable of tuples
@@ -162,11 +226,29 @@ impl YMap {
         }
     }
 
+    /// Checks if `key` is mapped to an entry in this instance of `YMap`.
+    /// Non-string probes are never present, matching `dict` semantics.
+    pub fn __contains__(&self, key: PyObject) -> bool {
+        let key: Result<String, _> = Python::with_gil(|py| key.extract(py));
+        key.ok()
+            .map(|key| match &self.0 {
+                SharedType::Integrated(map) => map.contains(&key),
+                SharedType::Prelim(map) => map.contains_key(&key),
+            })
+            .unwrap_or(false)
+    }
+
     /// Retrieves an item from the map. If the item isn't found, the fallback value is returned.
     pub fn get(&self, key: &str, fallback: Option<PyObject>) -> PyObject {
-        self.__getitem__(key)
-            .ok()
-            .unwrap_or_else(|| fallback.unwrap_or_else(|| Python::with_gil(|py| py.None())))
+        // Look the entry up directly rather than raising and swallowing the
+        // KeyError that __getitem__ builds for bracket notation
+        let entry = match &self.0 {
+            SharedType::Integrated(map) => map
+                .get(key)
+                .map(|value| Python::with_gil(|py| value.into_py(py))),
+            SharedType::Prelim(map) => map.get(key).cloned(),
+        };
+        entry.unwrap_or_else(|| fallback.unwrap_or_else(|| Python::with_gil(|py| py.None())))
     }
 
     /// Returns value of an entry stored under given `key` within this instance of `YMap`,
@@ -390,6 +472,32 @@ impl ValueView {
         let data = self.__str__();
         format!("ValueView({data})")
     }
+
+    fn __contains__(&self, el: PyObject) -> bool {
+        let target: Result<Any, _> = PyObjectWrapper(el.clone()).try_into();
+        unsafe {
+            match &*self.0 {
+                SharedType::Integrated(map) => {
+                    if let Ok(target) = target {
+                        map.iter().any(|(_, value)| match value {
+                            Value::Any(any) => py_any_eq(&any, &target),
+                            _ => false,
+                        })
+                    } else {
+                        Python::with_gil(|py| {
+                            map.iter().any(|(_, value)| {
+                                value.into_py(py).as_ref(py).eq(&el).unwrap_or(false)
+                            })
+                        })
+                    }
+                }
+                SharedType::Prelim(map) => Python::with_gil(|py| {
+                    map.values()
+                        .any(|value| value.as_ref(py).eq(&el).unwrap_or(false))
+                }),
+            }
+        }
+    }
 }
 
 pub enum InnerYMapIterator {
@@ -75,6 +75,15 @@ impl YText {
         format!("YText({})", self.__str__())
     }
 
+    /// Returns an underlying shared string stored in this data type.
+    ///
+    /// An already open `txn` may be passed in so the read can be batched with
+    /// writes made in the same transaction; reads themselves do not open one.
+    pub fn to_string(&self, txn: Option<&YTransaction>) -> String {
+        let _ = txn;
+        self.__str__()
+    }
+
     /// Returns length of an underlying string stored in this `YText` instance,
     /// understood as a number of UTF-8 encoded bytes.
     pub fn __len__(&self) -> usize {
@@ -1,4 +1,5 @@
 use crate::shared_types::SubId;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList};
 use std::mem::ManuallyDrop;
@@ -39,6 +40,13 @@ impl YXmlElement {
         self.0.tag().to_string()
     }
 
+    /// Returns an integer tag discriminating XML node types (0 for `YXmlText`, 1 for
+    /// `YXmlElement`), which is cheaper to branch on than `hasattr`/`isinstance` probes.
+    #[getter]
+    pub fn xml_kind(&self) -> u8 {
+        1
+    }
+
     /// Returns a number of child XML nodes stored within this `YXMlElement` instance.
     pub fn __len__(&self) -> usize {
         self.0.len() as usize
@@ -110,6 +118,25 @@ impl YXmlElement {
         })
     }
 
+    /// Returns a list of all direct children of this XML node, built in a single native walk
+    /// rather than hopping from `first_child` over `next_sibling` getters in Python.
+    #[getter]
+    pub fn children(&self) -> PyObject {
+        Python::with_gil(|py| {
+            let result = PyList::empty(py);
+            let mut child = self.0.first_child();
+            while let Some(xml) = child {
+                let next = match &xml {
+                    Xml::Element(el) => el.next_sibling(),
+                    Xml::Text(text) => text.next_sibling(),
+                };
+                result.append(xml.into_py(py)).unwrap();
+                child = next;
+            }
+            result.into()
+        })
+    }
+
     /// Returns a parent `YXmlElement` node or `undefined` if current node has no parent assigned.
     #[getter]
     pub fn parent(&self) -> Option<YXmlElement> {
@@ -153,6 +180,26 @@ impl YXmlElement {
         }
     }
 
+    /// Returns a dictionary of all attributes of this XML node, built in a single native call
+    /// rather than driving the `attributes()` iterator from Python.
+    pub fn attributes_dict(&self) -> PyObject {
+        Python::with_gil(|py| {
+            let result = PyDict::new(py);
+            for (name, value) in self.0.attributes() {
+                result.set_item(name, value).unwrap();
+            }
+            result.into()
+        })
+    }
+
+    /// Returns a dictionary representation of this XML node, where attributes are stored as
+    /// key-value entries and nested nodes are collected under a `"children"` key. The whole tree
+    /// is traversed in native code, which is much cheaper than walking `first_child`/`next_sibling`
+    /// from Python.
+    pub fn to_py_dict(&self) -> PyObject {
+        Python::with_gil(|py| xml_element_to_py_dict(py, &self.0))
+    }
+
     /// Returns an iterator that enables a deep traversal of this XML node - starting from first
     /// child over this XML node successors using depth-first strategy.
     pub fn tree_walker(&self) -> YXmlTreeWalker {
@@ -237,6 +284,13 @@ impl YXmlText {
         self.0.len() as usize
     }
 
+    /// Returns an integer tag discriminating XML node types (0 for `YXmlText`, 1 for
+    /// `YXmlElement`), which is cheaper to branch on than `hasattr`/`isinstance` probes.
+    #[getter]
+    pub fn xml_kind(&self) -> u8 {
+        0
+    }
+
     /// Inserts a given `chunk` of text into this `YXmlText` instance, starting at a given `index`.
     pub fn insert(&self, txn: &mut YTransaction, index: i32, chunk: &str) {
         self.0.insert(txn, index as u32, chunk)
@@ -324,6 +378,24 @@ impl YXmlText {
         }
     }
 
+    /// Returns a dictionary of all attributes of this XML node, built in a single native call
+    /// rather than driving the `attributes()` iterator from Python.
+    pub fn attributes_dict(&self) -> PyObject {
+        Python::with_gil(|py| {
+            let result = PyDict::new(py);
+            for (name, value) in self.0.attributes() {
+                result.set_item(name, value).unwrap();
+            }
+            result.into()
+        })
+    }
+
+    /// Returns a dictionary representation of this XML node, where attributes are stored as
+    /// key-value entries and the text content is stored under a `"text"` key.
+    pub fn to_py_dict(&self) -> PyObject {
+        Python::with_gil(|py| xml_text_to_py_dict(py, &self.0))
+    }
+
     /// Subscribes to all operations happening over this instance of `YXmlText`. All changes are
     /// batched and eventually triggered during transaction commit phase.
     /// Returns an `SubscriptionId` which, which can be used to unsubscribe the callback function.
@@ -628,6 +700,34 @@ impl YXmlTextEvent {
     }
 }
 
+fn xml_element_to_py_dict(py: Python, elem: &XmlElement) -> PyObject {
+    let result = PyDict::new(py);
+    for (name, value) in elem.attributes() {
+        result.set_item(name, value).unwrap();
+    }
+    let children = PyList::empty(py);
+    let mut child = elem.first_child();
+    while let Some(xml) = child {
+        let (py_child, next) = match &xml {
+            Xml::Element(el) => (xml_element_to_py_dict(py, el), el.next_sibling()),
+            Xml::Text(text) => (xml_text_to_py_dict(py, text), text.next_sibling()),
+        };
+        children.append(py_child).unwrap();
+        child = next;
+    }
+    result.set_item("children", children).unwrap();
+    result.into()
+}
+
+fn xml_text_to_py_dict(py: Python, text: &XmlText) -> PyObject {
+    let result = PyDict::new(py);
+    for (name, value) in text.attributes() {
+        result.set_item(name, value).unwrap();
+    }
+    result.set_item("text", text.to_string()).unwrap();
+    result.into()
+}
+
 // XML Type Conversions
 
 impl ToPython for Xml {
@@ -642,24 +742,24 @@ impl ToPython for Xml {
 impl<'a> ToPython for &EntryChange {
     fn into_py(self, py: Python) -> PyObject {
         let result = PyDict::new(py);
-        let action = "action";
+        let action = intern!(py, "action");
         match self {
             EntryChange::Inserted(new) => {
                 let new_value = new.clone().into_py(py);
-                result.set_item(action, "add").unwrap();
-                result.set_item("newValue", new_value).unwrap();
+                result.set_item(action, intern!(py, "add")).unwrap();
+                result.set_item(intern!(py, "newValue"), new_value).unwrap();
             }
             EntryChange::Updated(old, new) => {
                 let old_value = old.clone().into_py(py);
                 let new_value = new.clone().into_py(py);
-                result.set_item(action, "update").unwrap();
-                result.set_item("oldValue", old_value).unwrap();
-                result.set_item("newValue", new_value).unwrap();
+                result.set_item(action, intern!(py, "update")).unwrap();
+                result.set_item(intern!(py, "oldValue"), old_value).unwrap();
+                result.set_item(intern!(py, "newValue"), new_value).unwrap();
             }
             EntryChange::Removed(old) => {
                 let old_value = old.clone().into_py(py);
-                result.set_item(action, "delete").unwrap();
-                result.set_item("oldValue", old_value).unwrap();
+                result.set_item(action, intern!(py, "delete")).unwrap();
+                result.set_item(intern!(py, "oldValue"), old_value).unwrap();
             }
         }
         result.into()
@@ -7,9 +7,6 @@ def transact(self, callback):
 
 
 def exchange_updates(docs):
-    for d1 in docs:
-        for d2 in docs:
-            if d1 != d2:
-                state_vector = Y.encode_state_vector(d1)
-                diff = Y.encode_state_as_update(d2, state_vector)
-                Y.apply_update(d1, diff)
+    for i, d1 in enumerate(docs):
+        for d2 in docs[i + 1 :]:
+            Y.sync_pair(d1, d2)
@@ -1,3 +1,5 @@
+from array import array
+
 from test_helper import exchange_updates
 import pytest
 
@@ -28,6 +30,63 @@ def test_inserts():
     assert value == expected
 
 
+def test_insert_range_homogeneous():
+    """
+    Homogeneous primitive lists take a bulk conversion fast path.
+    Make sure types and edge values still round-trip through it.
+    """
+    d1 = YDoc(1)
+    x = d1.get_array("test")
+
+    big_int = 2 ** 53
+    with d1.begin_transaction() as txn:
+        x.insert_range(txn, 0, [1, 2, big_int])
+        x.insert_range(txn, 3, [1.5, 2.5])
+        x.insert_range(txn, 5, ["a", "b"])
+        # bools must not be coerced onto the int fast path
+        x.insert_range(txn, 7, [True, False])
+
+    assert x.to_json() == [1, 2, big_int, 1.5, 2.5, "a", "b", True, False]
+    assert type(x[2]) == int
+    assert type(x[7]) == bool
+
+
+def test_insert_range_length_hint_overestimate():
+    """
+    __length_hint__ is advisory and may over-estimate (PEP 424);
+    it must not be trusted for the conversion buffer size.
+    """
+
+    class OverestimatingIterable:
+        def __iter__(self):
+            return iter([1, 2])
+
+        def __length_hint__(self):
+            return 2 ** 40
+
+    d1 = YDoc(1)
+    x = d1.get_array("test")
+    with d1.begin_transaction() as txn:
+        x.insert_range(txn, 0, OverestimatingIterable())
+    assert x.to_json() == [1, 2]
+
+
+def test_insert_range_buffer():
+    d1 = YDoc(1)
+    x = d1.get_array("test")
+
+    with d1.begin_transaction() as txn:
+        x.insert_range_buffer(txn, 0, array("d", [1.0, 2.5]))
+        x.insert_range_buffer(txn, 2, array("q", [3, 2 ** 53]))
+
+    assert x.to_json() == [1.0, 2.5, 3, 2 ** 53]
+    assert type(x[3]) == int
+
+    with pytest.raises(TypeError):
+        with d1.begin_transaction() as txn:
+            x.insert_range_buffer(txn, 0, [1.0, 2.0])
+
+
 def test_to_string():
     arr = YArray([7, "awesome", True, ["nested"], {"testing": "dicts"}])
     expected_str = "[7, 'awesome', True, ['nested'], {'testing': 'dicts'}]"
@@ -127,6 +186,43 @@ def test_get():
         assert arr[::-1] == expected[::-1]
 
 
+def test_replace_all():
+    doc = YDoc()
+    arr = doc.get_array("test")
+    with doc.begin_transaction() as txn:
+        arr.insert_range(txn, 0, [1, 2, 3])
+    with doc.begin_transaction() as txn:
+        arr.replace_all(txn, ["a", "b"])
+
+    assert arr.to_json() == ["a", "b"]
+
+    prelim = YArray([1, 2, 3])
+    with doc.begin_transaction() as txn:
+        prelim.replace_all(txn, ["c"])
+    assert prelim.to_json() == ["c"]
+
+    # A non-iterable argument raises without destroying the content
+    for target in [arr, prelim]:
+        before = target.to_json()
+        with pytest.raises(TypeError):
+            with doc.begin_transaction() as txn:
+                target.replace_all(txn, 42)
+        assert target.to_json() == before
+
+
+def test_apply_ops():
+    doc = YDoc()
+    arr = doc.get_array("test")
+    with doc.begin_transaction() as txn:
+        arr.apply_ops(txn, [("insert", 0, [1, 2, 3]), ("delete", 0, 2)] * 2)
+
+    assert arr.to_json() == [3, 3]
+
+    with pytest.raises(ValueError):
+        with doc.begin_transaction() as txn:
+            arr.apply_ops(txn, [("replace", 0, [1])])
+
+
 def test_iterator():
     d1 = YDoc()
     x = d1.get_array("test")
@@ -141,6 +237,18 @@ def test_iterator():
         i += 1.0
     # Test contains
     assert 2.0 in x
+    assert 2 in x
+    assert 4 not in x
+    assert "missing" not in x
+    # Python equality semantics: bools and big ints compare by numeric value
+    assert True in x
+    y = d1.get_array("mixed")
+    with d1.begin_transaction() as txn:
+        y.insert_range(txn, 0, [True, False, 2 ** 53, [True]])
+    assert 1 in y
+    assert 0.0 in y
+    assert float(2 ** 53) in y
+    assert [1] in y
 
 
 def test_borrow_mut_edge_case():
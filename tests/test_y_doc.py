@@ -63,6 +63,29 @@ def test_boolean_encoding():
     assert type(value[0]) == type(True)
 
 
+def test_merge_updates():
+    """
+    Combines updates from multiple documents into a single payload that can be
+    applied in one `apply_update` call.
+    """
+    d1 = YDoc(1)
+    d2 = YDoc(2)
+    with d1.begin_transaction() as txn:
+        d1.get_array("test").insert(txn, 0, "a")
+    with d2.begin_transaction() as txn:
+        d2.get_array("test").insert(txn, 0, "b")
+
+    update = Y.merge_updates(
+        [Y.encode_state_as_update(d1), Y.encode_state_as_update(d2)]
+    )
+    assert type(update) == bytes
+
+    receiver = YDoc()
+    Y.apply_update(receiver, update)
+    value = receiver.get_array("test").to_json()
+    assert sorted(value) == ["a", "b"]
+
+
 def test_tutorial():
     d1 = Y.YDoc()
     text = d1.get_text("test")
@@ -79,6 +102,29 @@ def test_tutorial():
     assert value == "hello world!"
 
 
+def test_batch_transact():
+    d = Y.YDoc()
+    text = d.get_text("test")
+    commits = 0
+
+    def count_commits(event):
+        nonlocal commits
+        commits += 1
+
+    d.observe_after_transaction(count_commits)
+
+    results = d.batch_transact(
+        [
+            lambda txn: text.extend(txn, "hello"),
+            lambda txn: text.extend(txn, " world"),
+            lambda txn: str(text),
+        ]
+    )
+
+    assert results[2] == "hello world"
+    assert commits == 1
+
+
 def test_observe_after_transaction():
     doc = Y.YDoc()
     text = doc.get_text("test")
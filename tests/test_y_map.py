@@ -23,6 +23,14 @@ def test_get():
     # Ensure that indexing a non_existant key with bracket notation produces `KeyError`
     with pytest.raises(KeyError):
         m["doesn't exist"]
+    # Membership checks don't materialize values
+    assert "username" in m
+    assert "secretIdentity" not in m
+    assert "a" in YMap({"a": 1})
+    assert "b" not in YMap({"a": 1})
+    # Non-string probes are simply absent, as with a dict
+    assert 1 not in m
+    assert None not in YMap({"a": 1})
 
 
 def test_set():
@@ -69,6 +77,35 @@ def test_update():
             ymap.update(txn, [1])
 
 
+def test_eq_dict():
+    doc = Y.YDoc()
+    ymap = doc.get_map("dict")
+    vals = {"user_id": 1, "username": "Josh", "is_active": True}
+    with doc.begin_transaction() as txn:
+        ymap.update(txn, vals)
+
+    assert ymap == vals
+    assert ymap.equals_py_dict(vals)
+    # length mismatch short-circuits
+    assert ymap != {"user_id": 1}
+    # same length, different contents
+    assert ymap != {"user_id": 1, "username": "Josh", "is_active": False}
+    assert ymap != {"user_id": 1, "username": "Josh", "missing": True}
+    # bools compare equal to their numeric values, as in Python,
+    # including inside nested containers
+    assert ymap == {"user_id": True, "username": "Josh", "is_active": 1}
+    nested = doc.get_map("nested")
+    with doc.begin_transaction() as txn:
+        nested.update(txn, {"a": [1], "b": {"c": 0}})
+    assert nested == {"a": [True], "b": {"c": False}}
+    assert nested != {"a": [True], "b": {"c": True}}
+    # prelim maps compare the same way
+    assert YMap({"a": 1}) == {"a": 1}
+    assert YMap({"a": 1}) != {"a": 2}
+    # non-dict comparisons keep default semantics
+    assert ymap != "not a dict"
+
+
 def test_set_nested():
     d1 = Y.YDoc()
     x = d1.get_map("test")
@@ -168,6 +205,10 @@ def test_keys_values():
     assert "d" in keys
     assert 4 in values
 
+    # Bools compare by numeric value, as in Python and the sibling views
+    assert True in values
+    assert False not in values
+
     # Ensure key view operations
     assert len(keys) == 4
     assert len(values) == 4
@@ -11,8 +11,11 @@ def test_to_string():
     integrated = d.get_text("test")
     with d.begin_transaction() as txn:
         integrated.extend(txn, expected)
+        # reads can be batched into an open write transaction
+        assert integrated.to_string(txn) == expected
     for test in [prelim, integrated]:
         assert str(test) == expected
+        assert test.to_string() == expected
         assert test.to_json() == expected_json
         assert test.__repr__() == f"YText({expected})"
 
@@ -29,6 +29,7 @@ def test_attributes():
         for key, value in root.attributes():
             actual[key] = value
     assert actual == {"key1": "value1", "key2": "value2"}
+    assert root.attributes_dict() == actual
 
     with d1.begin_transaction() as txn:
         root.remove_attribute(txn, "key1")
@@ -39,6 +40,11 @@ def test_attributes():
 
     assert actual == {"key1": None, "key2": "value2"}
 
+    text = d1.get_xml_text("text-test")
+    with d1.begin_transaction() as txn:
+        text.set_attribute(txn, "key1", "value1")
+    assert text.attributes_dict() == {"key1": "value1"}
+
 
 def test_siblings():
     d1 = Y.YDoc()
@@ -77,6 +83,34 @@ def test_tree_walker():
     expected = ["<p>hello</p>", "hello", "world"]
     assert actual == expected
 
+    actual = [str(child) for child in root.children]
+    assert actual == ["<p>hello</p>", "world"]
+
+
+def test_to_py_dict():
+    d1 = Y.YDoc()
+    root = d1.get_xml_element("test")
+    with d1.begin_transaction() as txn:
+        root.set_attribute(txn, "key1", "value1")
+        b = root.push_xml_text(txn)
+        a = root.insert_xml_element(txn, 0, "p")
+        a.set_attribute(txn, "key2", "value2")
+        aa = a.push_xml_text(txn)
+        aa.push(txn, "hello")
+        b.push(txn, "world")
+
+    expected = {
+        "key1": "value1",
+        "children": [
+            {"key2": "value2", "children": [{"text": "hello"}]},
+            {"text": "world"},
+        ],
+    }
+    assert root.to_py_dict() == expected
+    assert b.to_py_dict() == {"text": "world"}
+    assert root.xml_kind == 1
+    assert b.xml_kind == 0
+
 
 def test_xml_text_observer():
     d1 = Y.YDoc()
@@ -75,6 +75,12 @@ class YDoc:
 
         """
     def transact(self, callback: Callable[[YTransaction]]): ...
+    def batch_transact(self, callbacks: List[Callable[[YTransaction], Any]]) -> List[Any]:
+        """
+        Runs a sequence of callbacks within a single transaction and returns their results.
+        Unlike calling `transact` once per callback, the document commits (and dispatches
+        observers, and encodes updates) only once for the whole batch.
+        """
     def get_map(self, name: str) -> YMap:
         """
         Returns:
@@ -236,6 +242,28 @@ def apply_update(doc: YDoc, diff: Union[YDocUpdate, List[int]]):
         apply_update(local_doc, remote_delta)
     """
 
+def sync_pair(doc_a: YDoc, doc_b: YDoc):
+    """
+    Synchronizes a pair of documents in both directions within a single native call. The
+    intermediate state vectors and update payloads never cross into Python, which saves two
+    encode/decode round-trips per pair compared to driving the exchange through
+    `encode_state_vector`/`encode_state_as_update`/`apply_update`.
+    """
+
+def merge_updates(updates: List[YDocUpdate]) -> YDocUpdate:
+    """
+    Merges a sequence of updates (encoded using lib0 v1 encoding) into a single update payload.
+    The combined update can be applied in one `apply_update` call, which is cheaper than applying
+    each of the source updates individually.
+
+    Example::
+
+        from y_py import YDoc, encode_state_as_update, apply_update, merge_updates
+
+        update = merge_updates([encode_state_as_update(doc) for doc in docs])
+        apply_update(local_doc, update)
+    """
+
 class YTransaction:
     """
     A transaction that serves as a proxy to document block store. Ypy shared data types execute
@@ -424,6 +452,12 @@ class YText:
         Returns:
             The underlying shared string stored in this data type.
         """
+    def to_string(self, txn: Optional[YTransaction] = None) -> str:
+        """
+        Returns the underlying shared string stored in this data type.
+        An already open `txn` may be passed in so the read can be batched with
+        writes made in the same transaction; reads themselves do not open one.
+        """
     def insert(
         self,
         txn: YTransaction,
@@ -564,10 +598,30 @@ class YArray:
         """
         Inserts a given range of `items` into this `YArray` instance, starting at given `index`.
         """
+    def insert_range_buffer(self, txn: YTransaction, index: int, buffer: Any):
+        """
+        Inserts a contiguous numeric buffer (anything exposing the buffer protocol, e.g.
+        `array.array` or a NumPy array) into this `YArray` instance, starting at given `index`.
+        The numbers are read straight out of the buffer, without materializing an intermediate
+        Python object per element.
+        """
     def append(self, txn: YTransaction, item: Any):
         """
         Adds a single item to the end of the `YArray`
         """
+    def replace_all(self, txn: YTransaction, items: Iterable):
+        """
+        Replaces the whole content of this `YArray` instance with a provided range of `items` in
+        one call, saving the `len()` round-trip and the separate delete/insert dispatches of the
+        `delete_range` + `extend` reset pattern.
+        """
+    def apply_ops(self, txn: YTransaction, ops: List[Tuple[str, int, Any]]):
+        """
+        Applies a batch of operations to this `YArray` instance in a single call. Each operation
+        is a tuple: `("insert", index, items)` inserts a range of `items` at `index`, while
+        `("delete", index, length)` removes `length` elements starting at `index`. Batching the
+        operations avoids one Python-to-Rust round-trip per mutation in tight loops.
+        """
     def extend(self, txn: YTransaction, items: Iterable):
         """
         Appends a sequence of `items` at the end of this `YArray` instance.
@@ -590,6 +644,11 @@ class YArray:
         Returns:
             The element stored under given `index` or a new list of elements from the slice range.
         """
+    def __contains__(self, item: Any) -> bool:
+        """
+        Checks if a provided `item` is stored within this instance of `YArray`. Primitive values
+        are compared natively, without converting every stored element back into a Python object.
+        """
     def __iter__(self) -> Iterator:
         """
         Returns:
@@ -694,6 +753,24 @@ class YMap:
         Returns:
             The string representation of the `YMap` wrapped in 'YMap()'
         """
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compares this `YMap` against a Python `dict` entry by entry without
+        materializing an intermediate dict. Comparisons against anything other
+        than a `dict` fall back to default Python semantics.
+        """
+    def equals_py_dict(self, other: dict) -> bool:
+        """
+        Checks whether this `YMap` holds the same entries as `other`.
+        Lengths are compared first, so a mismatch is detected without
+        converting any values.
+
+        Args:
+            other: A Python dictionary to compare against.
+
+        Returns:
+            True if both collections hold equal entries under equal keys.
+        """
     def to_json(self) -> dict:
         """
         Converts contents of this `YMap` instance into a JSON representation.
@@ -726,6 +803,12 @@ class YMap:
         Returns:
             The item at the key.
         """
+    def __contains__(self, key: Any) -> bool:
+        """
+        Checks whether `key` is mapped to an entry in this `YMap`, without
+        materializing the stored value. Non-string probes are never present,
+        matching `dict` semantics.
+        """
     def get(key: str, fallback: Any) -> Any | None:
         """
         Args:
@@ -891,7 +974,9 @@ class YXmlElement:
     """
 
     name: str
+    xml_kind: int
     first_child: Optional[Xml]
+    children: List[Xml]
     next_sibling: Optional[Xml]
     prev_sibling: Optional[Xml]
     parent: Optional[YXmlElement]
@@ -954,6 +1039,19 @@ class YXmlElement:
         Returns an iterator that enables to traverse over all attributes of this XML node in
         unspecified order.
         """
+    def attributes_dict(self) -> Dict[str, str]:
+        """
+        Returns:
+            A dictionary of all attributes of this XML node, built in a single native call rather
+            than driving the `attributes()` iterator from Python.
+        """
+    def to_py_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            A dictionary representation of this XML node, where attributes are stored as key-value
+            entries and nested nodes are collected under a `"children"` key. The whole tree is
+            traversed in native code.
+        """
     def tree_walker(self) -> YXmlTreeWalker:
         """
         Returns an iterator that enables a deep traversal of this XML node - starting from first
@@ -988,6 +1086,7 @@ class YXmlElement:
         """
 
 class YXmlText:
+    xml_kind: int
     next_sibling: Optional[Xml]
     prev_sibling: Optional[Xml]
     parent: Optional[YXmlElement]
@@ -1040,6 +1139,18 @@ class YXmlText:
             An iterator that enables to traverse over all attributes of this XML node in
         unspecified order.
         """
+    def attributes_dict(self) -> Dict[str, str]:
+        """
+        Returns:
+            A dictionary of all attributes of this XML node, built in a single native call rather
+            than driving the `attributes()` iterator from Python.
+        """
+    def to_py_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            A dictionary representation of this XML node, where attributes are stored as key-value
+            entries and the text content is stored under a `"text"` key.
+        """
     def observe(self, f: Callable[[YXmlTextEvent]]) -> SubscriptionId:
         """
         Subscribes to all operations happening over this instance of `YXmlText`. All changes are